@@ -1,64 +1,123 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+import multiprocessing
+import os
 from datetime import datetime
 from pathlib import Path
-import textwrap
+from typing import TYPE_CHECKING, Any
+import io
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from pptx.presentation import Presentation as PptxPresentation
+    from pptx.slide import Slide
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_PATH = ROOT / "data" / "hr_metrics_monthly.csv"
 OUTPUT_DIR = ROOT / "output"
 
+_PT15 = Pt(15)
+_PT16 = Pt(16)
+_PT20 = Pt(20)
+_PT30 = Pt(30)
+_TITLE_LEFT = Inches(0.6)
+_TITLE_WIDTH = Inches(12)
+_CHART_LEFT = Inches(0.7)
+_CHART_TOP = Inches(1.6)
+_CHART_WIDTH = Inches(12.0)
+
+# One reusable Figure per chart size, cleared between renders and kept for the life of the
+# process. Reuse only happens when charts of the same size render in the same process: serial
+# runs, library callers, and the paired trend-chart job in main()'s worker pool.
+_FIGURES: dict[tuple[float, float], Figure] = {}
+_OUTPUT_READY = False
+
+
+def _ensure_output_dir() -> None:
+    global _OUTPUT_READY
+    if not _OUTPUT_READY:
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        _OUTPUT_READY = True
+
 
 def load_data(path: Path) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"Metrics file not found: {path}")
-    df = pd.read_csv(path)
-    df["month_date"] = pd.to_datetime(df["month"] + "-01")
+    df = pd.read_csv(
+        path,
+        engine="pyarrow",
+        dtype={
+            "department": "category",
+            "headcount": "Int32",
+            "new_hires": "Int32",
+            "terminations": "Int32",
+            "open_positions": "Int32",
+            "time_to_fill_days": "Int16",
+            "offer_acceptance_rate": "float64",
+            "turnover_rate": "float64",
+        },
+    )
+    df["month_date"] = pd.to_datetime(df["month"], format="%Y-%m")
     return df
 
 
-def build_insights(df: pd.DataFrame) -> tuple[str, dict[str, pd.DataFrame]]:
-    monthly = (
-        df.groupby("month_date", as_index=False)
-        .agg(
-            headcount=("headcount", "sum"),
-            new_hires=("new_hires", "sum"),
-            terminations=("terminations", "sum"),
-            open_positions=("open_positions", "sum"),
-            avg_time_to_fill=("time_to_fill_days", "mean"),
-            avg_offer_acceptance=("offer_acceptance_rate", "mean"),
-            avg_turnover_rate=("turnover_rate", "mean"),
-        )
-        .sort_values("month_date")
+def build_insights(df: pd.DataFrame) -> tuple[str, dict[str, pd.DataFrame | dict[str, Any]]]:
+    # One scan at (month, department) grain; means are carried as sums + non-null counts so
+    # both the monthly roll-up and the latest-month department view stay exact and skip blanks.
+    by_month_dept = df.groupby(["month_date", "department"], observed=True).agg(
+        headcount=("headcount", "sum"),
+        new_hires=("new_hires", "sum"),
+        terminations=("terminations", "sum"),
+        open_positions=("open_positions", "sum"),
+        time_to_fill_days=("time_to_fill_days", "sum"),
+        time_to_fill_days_n=("time_to_fill_days", "count"),
+        offer_acceptance_rate=("offer_acceptance_rate", "sum"),
+        offer_acceptance_rate_n=("offer_acceptance_rate", "count"),
+        turnover_rate=("turnover_rate", "sum"),
+        turnover_rate_n=("turnover_rate", "count"),
+    )
+
+    monthly_totals = by_month_dept.groupby(level="month_date").sum()
+    monthly = pd.DataFrame(
+        {
+            "month_date": monthly_totals.index,
+            "headcount": monthly_totals["headcount"].to_numpy(),
+            "new_hires": monthly_totals["new_hires"].to_numpy(),
+            "terminations": monthly_totals["terminations"].to_numpy(),
+            "open_positions": monthly_totals["open_positions"].to_numpy(),
+            "avg_time_to_fill": (monthly_totals["time_to_fill_days"] / monthly_totals["time_to_fill_days_n"]).to_numpy(),
+            "avg_offer_acceptance": (monthly_totals["offer_acceptance_rate"] / monthly_totals["offer_acceptance_rate_n"]).to_numpy(),
+            "avg_turnover_rate": (monthly_totals["turnover_rate"] / monthly_totals["turnover_rate_n"]).to_numpy(),
+        }
     )
 
     monthly["headcount_mom_pct"] = monthly["headcount"].pct_change() * 100
     monthly["new_hires_mom_pct"] = monthly["new_hires"].pct_change() * 100
     monthly["turnover_mom_delta"] = monthly["avg_turnover_rate"].diff()
 
-    latest = monthly.iloc[-1]
-    prior = monthly.iloc[-2]
-
-    dept_latest = (
-        df[df["month_date"] == latest["month_date"]]
-        .groupby("department", as_index=False)
-        .agg(
-            headcount=("headcount", "sum"),
-            turnover_rate=("turnover_rate", "mean"),
-            time_to_fill_days=("time_to_fill_days", "mean"),
-        )
-        .sort_values("headcount", ascending=False)
-    )
+    latest = {col: monthly[col].iat[-1] for col in monthly.columns}
+    prior = {col: monthly[col].iat[-2] for col in monthly.columns}
+
+    latest_depts = by_month_dept.xs(latest["month_date"], level="month_date")
+    dept_latest = pd.DataFrame(
+        {
+            "department": latest_depts.index,
+            "headcount": latest_depts["headcount"].to_numpy(),
+            "turnover_rate": (latest_depts["turnover_rate"] / latest_depts["turnover_rate_n"]).to_numpy(),
+            "time_to_fill_days": (latest_depts["time_to_fill_days"] / latest_depts["time_to_fill_days_n"]).to_numpy(),
+        }
+    ).sort_values("headcount", ascending=False)
 
-    top_turnover = dept_latest.sort_values("turnover_rate", ascending=False).iloc[0]
-    best_ttf = dept_latest.sort_values("time_to_fill_days", ascending=True).iloc[0]
+    top_turnover = dept_latest.loc[dept_latest["turnover_rate"].idxmax()]
+    best_ttf = dept_latest.loc[dept_latest["time_to_fill_days"].idxmin()]
 
     exec_summary = (
         f"As of {latest['month_date'].strftime('%b %Y')}, total headcount is {int(latest['headcount'])} "
@@ -73,25 +132,52 @@ def build_insights(df: pd.DataFrame) -> tuple[str, dict[str, pd.DataFrame]]:
     return exec_summary, {
         "monthly": monthly,
         "dept_latest": dept_latest,
-        "latest": latest.to_frame().T,
-        "prior": prior.to_frame().T,
+        "latest": latest,
+        "prior": prior,
     }
 
 
-def save_chart_headcount(monthly: pd.DataFrame, out_path: Path) -> None:
-    plt.figure(figsize=(10, 5))
-    plt.plot(monthly["month_date"], monthly["headcount"], marker="o", linewidth=2.5)
-    plt.title("Total Headcount Trend")
-    plt.xlabel("Month")
-    plt.ylabel("Employees")
-    plt.grid(alpha=0.25)
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=160)
-    plt.close()
+def _figure(figsize: tuple[float, float]) -> Figure:
+    fig = _FIGURES.get(figsize)
+    if fig is None:
+        # matplotlib is imported on first render so loading data and computing
+        # insights never pays its import and font-cache start-up cost.
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        _FIGURES[figsize] = fig
+    else:
+        fig.clear()
+    return fig
+
+
+def _write_png(fig: Figure, out_path: Path) -> bytes:
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=160, pil_kwargs={"optimize": False})
+    data = buf.getvalue()
+    out_path.write_bytes(data)
+    return data
+
+
+def save_chart_headcount(monthly: pd.DataFrame, out_path: Path, fig: Figure | None = None) -> bytes:
+    if fig is None:
+        fig = _figure((10, 5))
+    ax = fig.subplots()
+    ax.plot(monthly["month_date"], monthly["headcount"], marker="o", linewidth=2.5)
+    ax.set_title("Total Headcount Trend")
+    ax.set_xlabel("Month")
+    ax.set_ylabel("Employees")
+    ax.grid(alpha=0.25)
+    fig.tight_layout()
+    return _write_png(fig, out_path)
 
 
-def save_chart_hiring(monthly: pd.DataFrame, out_path: Path) -> None:
-    fig, ax1 = plt.subplots(figsize=(10, 5))
+def save_chart_hiring(monthly: pd.DataFrame, out_path: Path, fig: Figure | None = None) -> bytes:
+    if fig is None:
+        fig = _figure((10, 5))
+    ax1 = fig.subplots()
     ax1.plot(monthly["month_date"], monthly["new_hires"], marker="o", label="New Hires", color="#1f77b4")
     ax1.set_ylabel("New Hires", color="#1f77b4")
     ax1.tick_params(axis="y", labelcolor="#1f77b4")
@@ -102,14 +188,15 @@ def save_chart_hiring(monthly: pd.DataFrame, out_path: Path) -> None:
     ax2.set_ylabel("Turnover Rate (%)", color="#d62728")
     ax2.tick_params(axis="y", labelcolor="#d62728")
 
-    plt.title("Hiring Activity vs Turnover Rate")
+    ax2.set_title("Hiring Activity vs Turnover Rate")
     fig.tight_layout()
-    plt.savefig(out_path, dpi=160)
-    plt.close()
+    return _write_png(fig, out_path)
 
 
-def save_chart_department(dept_latest: pd.DataFrame, out_path: Path) -> None:
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+def save_chart_department(dept_latest: pd.DataFrame, out_path: Path, fig: Figure | None = None) -> bytes:
+    if fig is None:
+        fig = _figure((12, 5))
+    axes = fig.subplots(1, 2)
 
     axes[0].bar(dept_latest["department"], dept_latest["headcount"], color="#2ca02c")
     axes[0].set_title("Headcount by Department")
@@ -121,31 +208,43 @@ def save_chart_department(dept_latest: pd.DataFrame, out_path: Path) -> None:
     axes[1].set_ylabel("Turnover Rate (%)")
     axes[1].tick_params(axis="x", rotation=35)
 
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=160)
-    plt.close()
+    fig.tight_layout()
+    return _write_png(fig, out_path)
+
+
+def _save_trend_charts(monthly: pd.DataFrame, headcount_path: Path, hiring_path: Path) -> dict[str, bytes]:
+    # Both trend charts are 10x5, so rendering them together shares one cached Figure.
+    return {
+        "headcount": save_chart_headcount(monthly, headcount_path),
+        "hiring": save_chart_hiring(monthly, hiring_path),
+    }
+
+
+def _save_department_charts(dept_latest: pd.DataFrame, out_path: Path) -> dict[str, bytes]:
+    return {"department": save_chart_department(dept_latest, out_path)}
 
 
 def add_title(slide, title: str, subtitle: str | None = None) -> None:
-    title_box = slide.shapes.add_textbox(Inches(0.6), Inches(0.3), Inches(12), Inches(0.8))
+    title_box = slide.shapes.add_textbox(_TITLE_LEFT, Inches(0.3), _TITLE_WIDTH, Inches(0.8))
     tf = title_box.text_frame
     p = tf.paragraphs[0]
     p.text = title
-    p.font.size = Pt(30)
+    p.font.size = _PT30
     p.font.bold = True
     p.font.name = "Calibri"
 
     if subtitle:
-        subtitle_box = slide.shapes.add_textbox(Inches(0.6), Inches(1.0), Inches(12), Inches(0.5))
+        subtitle_box = slide.shapes.add_textbox(_TITLE_LEFT, Inches(1.0), _TITLE_WIDTH, Inches(0.5))
         stf = subtitle_box.text_frame
         sp = stf.paragraphs[0]
         sp.text = subtitle
-        sp.font.size = Pt(16)
+        sp.font.size = _PT16
         sp.font.name = "Calibri"
 
 
-def build_presentation(exec_summary: str, frames: dict[str, pd.DataFrame], charts: dict[str, Path]) -> Path:
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+def _build_deck(
+    exec_summary: str, frames: dict[str, pd.DataFrame | dict[str, Any]]
+) -> tuple[PptxPresentation, dict[str, Slide]]:
     prs = Presentation()
     prs.slide_width = Inches(13.333)
     prs.slide_height = Inches(7.5)
@@ -160,34 +259,31 @@ def build_presentation(exec_summary: str, frames: dict[str, pd.DataFrame], chart
 
     header = tf.paragraphs[0]
     header.text = "Executive Summary"
-    header.font.size = Pt(20)
+    header.font.size = _PT20
     header.font.bold = True
 
     body = tf.add_paragraph()
-    body.text = textwrap.fill(exec_summary, width=120)
-    body.font.size = Pt(15)
+    body.text = exec_summary
+    body.font.size = _PT15
     body.level = 0
 
     # Slide 2: Headcount trends
     slide2 = prs.slides.add_slide(prs.slide_layouts[6])
     add_title(slide2, "Headcount Trends", "Monthly total headcount across all departments")
-    slide2.shapes.add_picture(str(charts["headcount"]), Inches(0.7), Inches(1.6), width=Inches(12.0))
 
     # Slide 3: Hiring metrics
     slide3 = prs.slides.add_slide(prs.slide_layouts[6])
     add_title(slide3, "Hiring Metrics", "New hires and turnover rate by month")
-    slide3.shapes.add_picture(str(charts["hiring"]), Inches(0.7), Inches(1.6), width=Inches(12.0))
 
     # Slide 4: Department breakdown
     slide4 = prs.slides.add_slide(prs.slide_layouts[6])
     add_title(slide4, "Departmental Breakdown", "Latest month headcount and turnover comparison")
-    slide4.shapes.add_picture(str(charts["department"]), Inches(0.7), Inches(1.6), width=Inches(12.0))
 
     # Slide 5: Key insights + recommendations
-    latest = frames["latest"].iloc[0]
+    latest = frames["latest"]
     dept_latest = frames["dept_latest"]
-    risk_dept = dept_latest.sort_values("turnover_rate", ascending=False).iloc[0]
-    low_hc_dept = dept_latest.sort_values("headcount", ascending=True).iloc[0]
+    risk_dept = dept_latest.loc[dept_latest["turnover_rate"].idxmax()]
+    low_hc_dept = dept_latest.loc[dept_latest["headcount"].idxmin()]
 
     slide5 = prs.slides.add_slide(prs.slide_layouts[6])
     add_title(slide5, "Key Insights & Recommendations")
@@ -205,21 +301,39 @@ def build_presentation(exec_summary: str, frames: dict[str, pd.DataFrame], chart
 
     first = tf5.paragraphs[0]
     first.text = bullets[0]
-    first.font.size = Pt(16)
+    first.font.size = _PT16
 
     for item in bullets[1:]:
         p = tf5.add_paragraph()
         p.text = item
         p.level = 0
-        p.font.size = Pt(16)
+        p.font.size = _PT16
+
+    return prs, {"headcount": slide2, "hiring": slide3, "department": slide4}
+
+
+def _save_deck(prs: PptxPresentation, chart_slides: dict[str, Slide], charts: dict[str, Path | bytes]) -> Path:
+    _ensure_output_dir()
+    for name, slide in chart_slides.items():
+        image = charts[name]
+        # Rendered PNG bytes are embedded straight from memory; paths are read from disk.
+        source = io.BytesIO(image) if isinstance(image, bytes) else str(image)
+        slide.shapes.add_picture(source, _CHART_LEFT, _CHART_TOP, width=_CHART_WIDTH)
 
     out_pptx = OUTPUT_DIR / "hr_metrics_executive_dashboard.pptx"
     prs.save(out_pptx)
     return out_pptx
 
 
+def build_presentation(
+    exec_summary: str, frames: dict[str, pd.DataFrame | dict[str, Any]], charts: dict[str, Path | bytes]
+) -> Path:
+    prs, chart_slides = _build_deck(exec_summary, frames)
+    return _save_deck(prs, chart_slides, charts)
+
+
 def main() -> None:
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_output_dir()
 
     df = load_data(DATA_PATH)
     exec_summary, frames = build_insights(df)
@@ -230,23 +344,33 @@ def main() -> None:
     hiring_chart = OUTPUT_DIR / "hiring_turnover_trend.png"
     dept_chart = OUTPUT_DIR / "department_breakdown.png"
 
-    save_chart_headcount(monthly, headcount_chart)
-    save_chart_hiring(monthly, hiring_chart)
-    save_chart_department(dept_latest, dept_chart)
-
-    pptx_path = build_presentation(
-        exec_summary,
-        frames,
-        {
-            "headcount": headcount_chart,
-            "hiring": hiring_chart,
-            "department": dept_chart,
-        },
-    )
-
     summary_path = OUTPUT_DIR / "executive_summary.txt"
     summary_path.write_text(exec_summary + "\n", encoding="utf-8")
 
+    chart_jobs = [
+        (_save_trend_charts, monthly, headcount_chart, hiring_chart),
+        (_save_department_charts, dept_latest, dept_chart),
+    ]
+
+    # On more than one core, charts render in parallel processes while the text-only parts
+    # of the deck are built here; forkserver avoids forking after pyarrow's CSV reader has
+    # started its native threads. On one core a pool only adds start-up and a second
+    # matplotlib import, so charts render in-process. Both paths assemble the deck the same way.
+    use_pool = (os.cpu_count() or 1) >= 2
+    pool_context = (
+        ProcessPoolExecutor(max_workers=len(chart_jobs), mp_context=multiprocessing.get_context("forkserver"))
+        if use_pool
+        else nullcontext()
+    )
+    with pool_context as pool:
+        futures = [pool.submit(*job) for job in chart_jobs] if use_pool else []
+        prs, chart_slides = _build_deck(exec_summary, frames)
+        charts: dict[str, bytes] = {}
+        for i, (render, *args) in enumerate(chart_jobs):
+            charts.update(futures[i].result() if use_pool else render(*args))
+
+    pptx_path = _save_deck(prs, chart_slides, charts)
+
     print("Executive Summary:")
     print(exec_summary)
     print(f"\nGenerated:\n- {pptx_path}\n- {summary_path}\n- {headcount_chart}\n- {hiring_chart}\n- {dept_chart}")
@@ -3,14 +3,62 @@ from __future__ import annotations
 from pathlib import Path
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
+_HIRING_BOOST_MONTHS = np.array([3, 4, 9, 10], dtype=np.int8)
+_SUMMER_TURNOVER_MONTHS = np.array([7, 8], dtype=np.int8)
+_FALL_TTF_MONTHS = np.array([10, 11], dtype=np.int8)
+_SUMMER_OFFER_MONTHS = np.array([6, 7], dtype=np.int8)
 
-def bounded(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
+
+def _generate(
+    month_num: np.ndarray,
+    baseline: np.ndarray,
+    trends: np.ndarray,
+    turnover_base: np.ndarray,
+    ttf_base: np.ndarray,
+    offer_base: np.ndarray,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, ...]:
+    shape = (len(month_num), len(baseline))
+    month_idx = np.arange(len(month_num))[:, None]
+
+    seasonal_hiring_boost = np.where(np.isin(month_num, _HIRING_BOOST_MONTHS), 1.2, 0.8)[:, None]
+    summer_turnover = np.where(np.isin(month_num, _SUMMER_TURNOVER_MONTHS), 0.002, 0.0)[:, None]
+    fall_ttf = np.where(np.isin(month_num, _FALL_TTF_MONTHS), 1.0, 0.0)[:, None]
+    summer_offer = np.where(np.isin(month_num, _SUMMER_OFFER_MONTHS), 0.015, 0.0)[:, None]
+
+    base_hc = baseline[None, :] + trends[None, :] * month_idx + rng.normal(0, 1.2, size=shape)
+    headcount = np.round(np.maximum(8, base_hc))
+
+    hire_rate = 0.035 * seasonal_hiring_boost
+    new_hires = np.round(np.maximum(0, headcount * hire_rate + rng.normal(0, 1.0, size=shape)))
+
+    turnover_rate = np.clip(
+        turnover_base[None, :] + rng.normal(0, 0.0035, size=shape) + summer_turnover,
+        0.004,
+        0.05,
+    )
+
+    terminations = np.round(np.maximum(0, headcount * turnover_rate + rng.normal(0, 0.6, size=shape)))
+    open_positions = np.round(
+        np.maximum(0, new_hires * rng.uniform(1.1, 2.2, size=shape) + rng.normal(0, 1.2, size=shape))
+    )
+
+    time_to_fill = np.round(np.maximum(15, ttf_base[None, :] + rng.normal(0, 4, size=shape) - fall_ttf))
+
+    offer_acceptance_rate = np.clip(
+        offer_base[None, :] + rng.normal(0, 0.03, size=shape) - summer_offer,
+        0.62,
+        0.95,
+    )
+
+    return headcount, new_hires, terminations, open_positions, time_to_fill, offer_acceptance_rate, turnover_rate
 
 
 def main() -> None:
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
 
     months = pd.date_range("2025-02-01", "2026-01-01", freq="MS")
     departments = ["Engineering", "Sales", "Operations", "HR", "Finance", "Customer Success"]
@@ -33,78 +81,59 @@ def main() -> None:
         "Customer Success": 0.8,
     }
 
-    rows = []
-    for month_idx, month in enumerate(months):
-        seasonal_hiring_boost = 1.2 if month.month in [3, 4, 9, 10] else 0.8
-
-        for dept in departments:
-            base_hc = baseline[dept] + trends[dept] * month_idx + np.random.normal(0, 1.2)
-            headcount = int(round(max(8, base_hc)))
-
-            hire_rate = 0.035 * seasonal_hiring_boost
-            new_hires = int(round(max(0, headcount * hire_rate + np.random.normal(0, 1.0))))
-
-            turnover_base = {
-                "Engineering": 0.011,
-                "Sales": 0.019,
-                "Operations": 0.015,
-                "HR": 0.010,
-                "Finance": 0.009,
-                "Customer Success": 0.017,
-            }[dept]
-
-            turnover_rate = bounded(
-                turnover_base + np.random.normal(0, 0.0035) + (0.002 if month.month in [7, 8] else 0),
-                0.004,
-                0.05,
-            )
-
-            terminations = int(round(max(0, headcount * turnover_rate + np.random.normal(0, 0.6))))
-            open_positions = int(round(max(0, new_hires * np.random.uniform(1.1, 2.2) + np.random.normal(0, 1.2))))
-
-            ttf_base = {
-                "Engineering": 47,
-                "Sales": 34,
-                "Operations": 31,
-                "HR": 29,
-                "Finance": 36,
-                "Customer Success": 26,
-            }[dept]
-            time_to_fill = int(round(max(15, ttf_base + np.random.normal(0, 4) - (1 if month.month in [10, 11] else 0))))
-
-            offer_acceptance_rate = bounded(
-                {
-                    "Engineering": 0.82,
-                    "Sales": 0.79,
-                    "Operations": 0.84,
-                    "HR": 0.86,
-                    "Finance": 0.81,
-                    "Customer Success": 0.83,
-                }[dept]
-                + np.random.normal(0, 0.03)
-                - (0.015 if month.month in [6, 7] else 0),
-                0.62,
-                0.95,
-            )
-
-            rows.append(
-                {
-                    "month": month.strftime("%Y-%m"),
-                    "department": dept,
-                    "headcount": headcount,
-                    "new_hires": new_hires,
-                    "terminations": terminations,
-                    "open_positions": open_positions,
-                    "time_to_fill_days": time_to_fill,
-                    "offer_acceptance_rate": round(offer_acceptance_rate * 100, 1),
-                    "turnover_rate": round(turnover_rate * 100, 2),
-                }
-            )
-
-    df = pd.DataFrame(rows)
+    turnover_base = {
+        "Engineering": 0.011,
+        "Sales": 0.019,
+        "Operations": 0.015,
+        "HR": 0.010,
+        "Finance": 0.009,
+        "Customer Success": 0.017,
+    }
+
+    ttf_base = {
+        "Engineering": 47,
+        "Sales": 34,
+        "Operations": 31,
+        "HR": 29,
+        "Finance": 36,
+        "Customer Success": 26,
+    }
+
+    offer_base = {
+        "Engineering": 0.82,
+        "Sales": 0.79,
+        "Operations": 0.84,
+        "HR": 0.86,
+        "Finance": 0.81,
+        "Customer Success": 0.83,
+    }
+
+    headcount, new_hires, terminations, open_positions, time_to_fill, offer_acceptance_rate, turnover_rate = _generate(
+        months.month.to_numpy(),
+        np.array([baseline[d] for d in departments], dtype=float),
+        np.array([trends[d] for d in departments]),
+        np.array([turnover_base[d] for d in departments]),
+        np.array([ttf_base[d] for d in departments], dtype=float),
+        np.array([offer_base[d] for d in departments]),
+        rng,
+    )
+
+    df = pd.DataFrame(
+        {
+            "month": np.repeat(months.strftime("%Y-%m").to_numpy(), len(departments)),
+            "department": np.tile(departments, len(months)),
+            "headcount": headcount.ravel().astype(np.int32),
+            "new_hires": new_hires.ravel().astype(np.int32),
+            "terminations": terminations.ravel().astype(np.int32),
+            "open_positions": open_positions.ravel().astype(np.int32),
+            "time_to_fill_days": time_to_fill.ravel().astype(np.int32),
+            "offer_acceptance_rate": np.round(offer_acceptance_rate.ravel() * 100, 1).astype(np.float32),
+            "turnover_rate": np.round(turnover_rate.ravel() * 100, 2).astype(np.float32),
+        }
+    )
     out = Path(__file__).resolve().parents[1] / "data" / "hr_metrics_monthly.csv"
     out.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(out, index=False)
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(out))
 
     print(f"Generated mock dataset: {out}")
     print(f"Rows: {len(df)} | Months: {df['month'].nunique()} | Departments: {df['department'].nunique()}")